@@ -2,14 +2,31 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Optional
-import hashlib
+import functools
+import html
+import os
+import re
+import shutil
+import stat
 import tempfile
+import textwrap
 import sys
+import zlib
 
 from version import __version__, __app_name__
 
 from PyQt6.QtWebEngineCore import QWebEnginePage
-from PyQt6.QtCore import Qt, QUrl, QSettings
+from PyQt6.QtCore import (
+    Qt,
+    QUrl,
+    QSettings,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QFileSystemWatcher,
+    pyqtSignal,
+)
 from PyQt6.QtGui import (
     QAction,
     QKeySequence,
@@ -38,6 +55,203 @@ from PyQt6.QtWidgets import (
 from transformer import XmlToStyledHtmlTransformer
 
 
+# 右側表示が空の時の案内メッセージ（毎回組み立てないように、import 時に bytes として作っておく）
+_EMPTY_MESSAGE = (
+    "左側のメニューよりフォルダを開いてxmlファイルを選択するか、"
+    "xmlファイルをここにドラッグ・アンド・ドロップしてください。"
+)
+
+_EMPTY_HTML_BYTES = textwrap.dedent("""\
+        <!doctype html>
+        <html>
+        <head>
+        <meta charset="utf-8" />
+        <style>
+            html, body {
+            height: 100%;
+            margin: 0;
+            }
+            body {
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-family: sans-serif;
+            background: #ffffff;
+            color: #333;
+            }
+            .box {
+            max-width: 720px;
+            padding: 24px 28px;
+            border: 1px solid #ddd;
+            border-radius: 12px;
+            line-height: 1.8;
+            font-size: 16px;
+            }
+        </style>
+        </head>
+        <body>
+        <div class="box">""" + _EMPTY_MESSAGE + """</div>
+        </body>
+        </html>
+        """).encode("utf-8")
+
+
+def _find_app_icon_path() -> Optional[Path]:
+    """
+    ico の探索：
+    - 開発時: main_window.py と同じフォルダ
+    - exe運用時: exe と同じフォルダ
+    """
+    candidates: list[Path] = [
+        Path(__file__).resolve().parent / "ico_xml_viewer.ico",
+        Path(sys.executable).resolve().parent / "ico_xml_viewer.ico",
+    ]
+    for p in candidates:
+        if p.exists():
+            return p
+    return None
+
+
+# アイコンの場所は import 時に一度だけ探す
+_APP_ICON_PATH: Optional[Path] = _find_app_icon_path()
+
+
+@functools.lru_cache(maxsize=None)
+def _app_icon() -> Optional[QIcon]:
+    """
+    アプリのアイコンを返す（ウィンドウが複数あっても ico の読み込みは1回だけ）。
+    QIcon は QApplication 生成後に作る必要があるため、初回呼び出し時に作る。
+    """
+    if _APP_ICON_PATH is None:
+        return None
+    return QIcon(str(_APP_ICON_PATH))
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """path を1回だけ stat する。存在しない・読めない場合は None。"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _scan_folder(folder: Path) -> tuple[list[str], list[str]]:
+    """
+    folder 直下のサブフォルダ名と XML ファイル名を、それぞれ名前順で返す。
+    Path.iterdir / glob はエントリごとに Path 生成と stat を行うため、
+    os.scandir で名前だけを見て振り分ける。
+    """
+    subdirs: list[str] = []
+    xml_names: list[str] = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+            elif entry.name.lower().endswith(".xml"):
+                xml_names.append(entry.name)
+    subdirs.sort()
+    xml_names.sort()
+    return subdirs, xml_names
+
+
+def _preview_name_prefix(xml_path: Path, xml_stat: os.stat_result) -> str:
+    """
+    プレビュー HTML のファイル名のうち、XML ファイルごとに決まる部分を返す。
+    同名XMLが別フォルダにあっても衝突しないように、ファイル固有の番号（inode / ファイルID）を付与する。
+    """
+    if xml_stat.st_ino:
+        file_id = f"{xml_stat.st_dev:x}-{xml_stat.st_ino:x}"
+    else:
+        # inode が取れないファイルシステムではパスから求める
+        file_id = f"{zlib.crc32(str(xml_path).encode('utf-8')):x}"
+    return f"{xml_path.stem}__preview__{file_id}-"
+
+
+def _preview_html_path(
+    preview_dir: Path,
+    xml_path: Path,
+    xml_stat: os.stat_result,
+    xsl_path: Path,
+) -> Path:
+    """
+    XML と、変換に実際に使った XSL から、プレビュー HTML のパスを決める。
+    XML / XSL の更新日時と XSL のパスもファイル名に含めるので、
+    同じファイルが既に存在すれば変換済みのプレビューとしてそのまま使える。
+    XSL を stat できない場合は OSError。
+    """
+    xsl_mtime = os.stat(xsl_path).st_mtime_ns
+    xsl_id = zlib.crc32(str(xsl_path).encode("utf-8"))
+    return preview_dir / (
+        f"{_preview_name_prefix(xml_path, xml_stat)}"
+        f"{xml_stat.st_mtime_ns:x}-{xsl_id:x}-{xsl_mtime:x}.html"
+    )
+
+
+def _preview_view_path(preview_html: Path) -> Path:
+    """大きい HTML を表示するときに開く、<base> 入りの表示用ファイルのパス"""
+    return preview_html.with_name(preview_html.stem + ".view.html")
+
+
+# <head ...> の開始タグ（表示用ファイルに <base> を入れる位置）
+_HEAD_OPEN_RE = re.compile(rb"<head\b[^>]*>", re.IGNORECASE)
+_BASE_TAG_RE = re.compile(rb"<base\b", re.IGNORECASE)
+
+
+def _with_base_href(html_bytes: bytes, base_dir: Path) -> Optional[bytes]:
+    """
+    html_bytes の <head> の直後に <base href="base_dir/"> を入れたものを返す。
+    相対参照（画像・CSS など）を、temp ではなく base_dir から解決させるために使う。
+    <head> が見つからない（UTF-16 など ASCII 互換でない encoding も含む）、
+    または XSL 側ですでに <base> を書いている場合は None。
+    """
+    head_open = _HEAD_OPEN_RE.search(html_bytes)
+    if head_open is None:
+        return None
+    head_close = html_bytes.find(b"</head>", head_open.end())
+    if _BASE_TAG_RE.search(html_bytes, head_open.end(), head_close if head_close >= 0 else len(html_bytes)):
+        return None
+
+    href = bytes(QUrl.fromLocalFile(base_dir.as_posix() + "/").toEncoded()).decode("ascii")
+    base_tag = f'\n<base href="{html.escape(href)}">'.encode("ascii")
+    pos = head_open.end()
+    return b"".join((memoryview(html_bytes)[:pos], base_tag, memoryview(html_bytes)[pos:]))
+
+
+def _write_file_atomically(path: Path, data: bytes) -> None:
+    """
+    書きかけのファイルを使わせないよう、一時名（.part）で書いてから置き換える。
+    失敗した場合は .part を残さない。
+    """
+    part_path = path.with_name(path.name + ".part")
+    try:
+        part_path.write_bytes(data)
+        os.replace(part_path, path)
+    except Exception:
+        try:
+            part_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
+
+
+def _remove_old_previews(preview_html: Path, name_prefix: str) -> None:
+    """
+    preview_html と同じ XML から作った古いプレビュー（更新前の XML / XSL のもの、
+    書きかけの .part を含む）を削除する。削除できないものは放っておく。
+    """
+    keep = (preview_html.name, _preview_view_path(preview_html).name)
+    try:
+        with os.scandir(preview_html.parent) as it:
+            for entry in it:
+                if entry.name.startswith(name_prefix) and entry.name not in keep:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+
+
 class HelpReadmeDialog(QDialog):
     """README（使い方）をツール内で表示するためのシンプルなダイアログ"""
 
@@ -63,7 +277,7 @@ class DroppableWebEngineView(QWebEngineView):
     """
     HTML表示エリア（QWebEngineView）でドラッグ＆ドロップを確実に受けるためのサブクラス。
     - 親Widgetに被せる方式は、WebEngine側にイベントが吸われて効かないことがあるため採用しない
-    - ここで dropEvent を拾って MainWindow.open_xml_via_drop() を呼ぶ
+    - ここで dropEvent を拾って MainWindow.open_xml_via_drop() を呼ぶ（処理はイベントループに戻ってから）
     """
 
     def __init__(self, owner: "MainWindow", parent: QWidget | None = None) -> None:
@@ -99,9 +313,69 @@ class DroppableWebEngineView(QWebEngineView):
             return
 
         xml_path = Path(urls[0].toLocalFile())
-        self._owner.open_xml_via_drop(xml_path)
         event.acceptProposedAction()
 
+        # dropEvent の間はドラッグ元（エクスプローラ等）が固まるため、
+        # 重い処理（ツリー構築・変換）はイベントループに戻ってから行う
+        QTimer.singleShot(0, lambda: self._owner.open_xml_via_drop(xml_path))
+
+
+class _XsltWorkerSignals(QObject):
+    """_XsltWorker の完了通知用シグナル（QRunnable は QObject ではないため別に持つ）"""
+
+    # (request_id, 出力した HTML のパス, HTML のバイト列)
+    finished = pyqtSignal(int, object, bytes)
+    # (request_id, 発生した例外)
+    error = pyqtSignal(int, object)
+
+
+class _XsltWorker(QRunnable):
+    """
+    XSLT 変換をバックグラウンドで実行し、プレビュー用 HTML を書き出すワーカー。
+    - プレビューのファイル名は、変換で実際に使った XSL から決める
+    - 書きかけのファイルをプレビューとして使わないよう、一時名で書いてから置き換える
+    - setContent で渡せない大きさの HTML は、<base> 入りの表示用ファイルも書く
+    - 書き終えたら、同じ XML の古いプレビューを削除する（temp に溜まり続けないように）
+    - 結果（HTML のバイト列も含む）は signals 経由で GUI スレッドに通知する
+    """
+
+    def __init__(
+        self,
+        request_id: int,
+        transformer: XmlToStyledHtmlTransformer,
+        xml_path: Path,
+        xml_stat: os.stat_result,
+        preview_dir: Path,
+        set_content_max_bytes: int,
+    ) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.signals = _XsltWorkerSignals()
+        self._transformer = transformer
+        self._xml_path = xml_path
+        self._xml_stat = xml_stat
+        self._preview_dir = preview_dir
+        self._set_content_max_bytes = set_content_max_bytes
+
+    def run(self) -> None:
+        try:
+            html_bytes, xsl_path = self._transformer.transform_to_html_bytes_with_xsl(self._xml_path)
+            output_path = _preview_html_path(self._preview_dir, self._xml_path, self._xml_stat, xsl_path)
+            _write_file_atomically(output_path, html_bytes)
+
+            if len(html_bytes) > self._set_content_max_bytes:
+                # ファイルで開く大きさの HTML は、相対参照が XML のフォルダから解決されるよう
+                # <base> を入れた表示用のファイルも作る（プレビュー本体は保存用にそのまま残す）
+                view_bytes = _with_base_href(html_bytes, self._xml_path.parent)
+                if view_bytes is not None:
+                    _write_file_atomically(_preview_view_path(output_path), view_bytes)
+        except Exception as e:
+            self.signals.error.emit(self.request_id, e)
+            return
+
+        _remove_old_previews(output_path, _preview_name_prefix(self._xml_path, self._xml_stat))
+        self.signals.finished.emit(self.request_id, output_path, html_bytes)
+
 
 class MainWindow(QMainWindow):
     """
@@ -113,6 +387,17 @@ class MainWindow(QMainWindow):
     ORG_NAME = "SurugaLab"
     APP_NAME = "XmlStyledViewer"
 
+    # setContent で直接渡す HTML の上限。QtWebEngine は data: URL 経由で読み込むため
+    # 2MB 程度が上限で、それを超えるものは temp のプレビューファイルを開く
+    # setContent では baseUrl を XML にして相対参照を解決する。上限を超える HTML は
+    # <base href="XML のフォルダ"> を入れた表示用ファイルを開いて、同じように解決させる
+    # （<head> を探せない UTF-16 などの HTML だけは、temp のフォルダから解決される）
+    SET_CONTENT_MAX_BYTES = 1024 * 1024
+
+    # フォルダ遷移履歴・フォルダ一覧キャッシュの上限（長時間使ってもメモリが増え続けないように）
+    FOLDER_HISTORY_MAX = 50
+    TREE_CACHE_MAX = 500
+
     def __init__(self, initial_xml: Optional[Path] = None) -> None:
         super().__init__()
 
@@ -124,7 +409,7 @@ class MainWindow(QMainWindow):
 
         self.settings = QSettings(self.ORG_NAME, self.APP_NAME)
 
-        # 現在開いている XML ファイルパス
+        # 現在表示している XML ファイルパス（保存・PDF 出力の対象）
         self.current_xml: Optional[Path] = None
 
         # 現在のツリーのルートフォルダ
@@ -134,9 +419,32 @@ class MainWindow(QMainWindow):
         self._folder_history: list[Path] = []
         self._folder_history_index: int = -1  # -1 は未設定
 
+        # フォルダ直下の一覧キャッシュ（戻る/進む・再展開でフォルダを読み直さない）
+        # folder -> (フォルダの st_mtime_ns, (サブフォルダ名, XML ファイル名))
+        self._tree_cache: dict[Path, tuple[int, tuple[list[str], list[str]]]] = {}
+
+        # 表示中のルートフォルダだけを監視し、OS から変更通知が来たらキャッシュを捨てる。
+        # 監視中のフォルダは Windows では名前変更・移動ができなくなるので、監視は常に1つだけにする
+        # （それ以外のフォルダのキャッシュは、使う前にフォルダの更新日時で確かめる）
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_watched_directory_changed)
+        self._watched_folder: Optional[Path] = None
+
         # Transformer (XML + XSL → HTML)
         self.transformer = XmlToStyledHtmlTransformer()
 
+        # XSLT 変換用のスレッドプール（変換中も画面が固まらないように）
+        # プレビュー用の変換は1本ずつ順番に行う（古い要求はキューから外せるように）。
+        # HTML 保存は GUI スレッドで変換するので、transformer はこのプールと同時に使われることがある
+        # （パーサはスレッドごと、キャッシュはロック付きなので問題ない）
+        self._xslt_pool = QThreadPool(self)
+        self._xslt_pool.setMaxThreadCount(1)
+
+        # 表示要求の通し番号（古い変換結果で表示を上書きしないため）
+        self._xslt_request_id: int = 0
+        # 変換中（まだ表示していない）の XML。表示が切り替わるまで current_xml は変えない
+        self._pending_xml: Optional[Path] = None
+
         # UI 構築
         self._setup_ui()
         self._create_actions()
@@ -145,6 +453,11 @@ class MainWindow(QMainWindow):
 
         # 検索用テキスト
         self._search_text: str = ""
+        # 検索ハイライトが表示されている可能性があるか（不要な findText("") を送らないため）
+        self._search_highlighted: bool = False
+
+        # README.md の内容キャッシュ（st_mtime_ns, テキスト）
+        self._readme_cache: Optional[tuple[int, str]] = None
 
         # ステータスバー初期表示
         self.statusBar().showMessage("準備完了")
@@ -161,27 +474,12 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # アイコン関連
     # ------------------------------------------------------------------
-    def _app_icon_path(self) -> Optional[Path]:
-        """
-        ico の探索：
-        - 開発時: main_window.py と同じフォルダ
-        - exe運用時: exe と同じフォルダ
-        """
-        candidates: list[Path] = [
-            Path(__file__).resolve().parent / "ico_xml_viewer.ico",
-            Path(sys.executable).resolve().parent / "ico_xml_viewer.ico",
-        ]
-        for p in candidates:
-            if p.exists():
-                return p
-        return None
-
     def _apply_app_icon(self) -> None:
-        icon_path = self._app_icon_path()
-        if icon_path is None:
+        icon = _app_icon()
+        if icon is None:
             # アイコンが無くても動作はするので、警告は出さない（必要なら出してOK）
             return
-        self.setWindowIcon(QIcon(str(icon_path)))
+        self.setWindowIcon(icon)
 
     # ------------------------------------------------------------------
     # UI 構築
@@ -241,6 +539,7 @@ class MainWindow(QMainWindow):
         self.tree = QTreeWidget(left_panel)
         self.tree.setHeaderHidden(True)
         self.tree.itemDoubleClicked.connect(self._on_tree_item_double_clicked)
+        self.tree.itemExpanded.connect(self._on_tree_item_expanded)
         left_layout.addWidget(self.tree, 1)
 
         # 「フォルダを開く」ボタンを左下に配置
@@ -300,8 +599,10 @@ class MainWindow(QMainWindow):
             return
 
         # 検索語が変わった時だけ、以前のハイライトを消す（毎回消すと「次へ」が進まない）
-        if text != self._search_text:
+        # ハイライトが出ていなければ消す必要も無いので、レンダラへの呼び出しを省く
+        if text != self._search_text and self._search_highlighted:
             page.findText("")
+            self._search_highlighted = False
 
         self._search_text = text
 
@@ -314,6 +615,7 @@ class MainWindow(QMainWindow):
         if page is None:
             return
         page.findText("")
+        self._search_highlighted = False
         self.statusBar().showMessage("検索ハイライトをクリアしました。", 3000)
 
     def _handle_search_result(self, found: bool) -> None:
@@ -322,6 +624,7 @@ class MainWindow(QMainWindow):
             return
 
         if found:
+            self._search_highlighted = True
             self.statusBar().showMessage(f"「{self._search_text}」が見つかりました。", 3000)
         else:
             self.statusBar().showMessage(f"「{self._search_text}」はこれ以上見つかりませんでした。", 3000)
@@ -395,15 +698,23 @@ class MainWindow(QMainWindow):
         return Path(__file__).resolve().parent / "README.md"
 
     def _load_readme_text(self) -> str:
+        """README.md を読み込む。更新日時が前回と同じならキャッシュした内容を返す。"""
         path = self._readme_path()
-        if not path.exists():
+        st = _stat_or_none(path)
+        if st is None:
             return (
                 "README.md が見つかりませんでした。\n\n"
                 f"想定パス:\n{path}\n\n"
                 "README.md を main_window.py と同じフォルダに置いてください。"
             )
+
+        if self._readme_cache is not None and self._readme_cache[0] == st.st_mtime_ns:
+            return self._readme_cache[1]
+
         # MarkdownなのでUTF-8で読み込み（社内運用なら基本これでOK）
-        return path.read_text(encoding="utf-8", errors="replace")
+        text = path.read_text(encoding="utf-8", errors="replace")
+        self._readme_cache = (st.st_mtime_ns, text)
+        return text
 
     def _on_help_show_readme(self) -> None:
         text = self._load_readme_text()
@@ -447,7 +758,8 @@ class MainWindow(QMainWindow):
 
     def _navigate_to_folder(self, folder_path: Path, push_history: bool = True) -> None:
         """指定フォルダをツリーに表示し、必要なら履歴に積む。"""
-        if not folder_path.exists() or not folder_path.is_dir():
+        st = _stat_or_none(folder_path)
+        if st is None or not stat.S_ISDIR(st.st_mode):
             QMessageBox.warning(self, "フォルダが存在しません", str(folder_path))
             return
 
@@ -463,6 +775,9 @@ class MainWindow(QMainWindow):
                 pass
             else:
                 self._folder_history.append(folder_path)
+                # 古い履歴から捨てる
+                if len(self._folder_history) > self.FOLDER_HISTORY_MAX:
+                    self._folder_history = self._folder_history[-self.FOLDER_HISTORY_MAX :]
                 self._folder_history_index = len(self._folder_history) - 1
 
         self.current_folder = folder_path
@@ -498,58 +813,39 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # 表示用HTML（tempプレビュー）関連
     # ------------------------------------------------------------------
-    def _get_preview_html_path(self, xml_path: Path) -> Path:
+    def _get_preview_dir(self) -> Path:
         """
-        表示用のHTMLを一時フォルダに作成する。
-        同名XMLが別フォルダにあっても衝突しないように、フルパスのハッシュを付与する。
+        表示用HTMLを置く一時フォルダを返す。
+        アプリのバージョンごとにフォルダを分け、CSS 等が変わった版の古いプレビューは使わない。
         """
-        temp_root = Path(tempfile.gettempdir()) / self.APP_NAME
-        temp_root.mkdir(parents=True, exist_ok=True)
+        preview_dir = Path(tempfile.gettempdir()) / self.APP_NAME / __version__
+        preview_dir.mkdir(parents=True, exist_ok=True)
+        return preview_dir
+
+    def _find_fresh_preview(self, xml_path: Path, xml_stat: os.stat_result | None = None) -> Optional[Path]:
+        """
+        現在の XML / XSL から変換済みのプレビュー HTML があれば、そのパスを返す。
+        XSL は transformer が前回の変換で実際に決定したもの（xml-stylesheet の href）を使う。
+        まだ変換していない XML・更新された XML・プレビューが無い場合は None（変換が必要）。
+        """
+        xsl_path = self.transformer.get_resolved_xsl_path(xml_path)
+        if xsl_path is None:
+            return None
+
+        if xml_stat is None:
+            xml_stat = _stat_or_none(xml_path)
+            if xml_stat is None:
+                return None
+
+        try:
+            preview_html = _preview_html_path(self._get_preview_dir(), xml_path, xml_stat, xsl_path)
+        except OSError:
+            return None
+        return preview_html if preview_html.exists() else None
 
-        h = hashlib.sha1(str(xml_path).encode("utf-8")).hexdigest()[:10]
-        return temp_root / f"{xml_path.stem}__preview__{h}.html"
-    
     def _show_empty_message(self) -> None:
         """右側表示が空の時の案内メッセージを表示する。"""
-        msg = (
-            "左側のメニューよりフォルダを開いてxmlファイルを選択するか、"
-            "xmlファイルをここにドラッグ・アンド・ドロップしてください。"
-        )
-
-        html = f"""
-        <!doctype html>
-        <html>
-        <head>
-        <meta charset="utf-8" />
-        <style>
-            html, body {{
-            height: 100%;
-            margin: 0;
-            }}
-            body {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-family: sans-serif;
-            background: #ffffff;
-            color: #333;
-            }}
-            .box {{
-            max-width: 720px;
-            padding: 24px 28px;
-            border: 1px solid #ddd;
-            border-radius: 12px;
-            line-height: 1.8;
-            font-size: 16px;
-            }}
-        </style>
-        </head>
-        <body>
-        <div class="box">{msg}</div>
-        </body>
-        </html>
-        """
-        self.view.setHtml(html)
+        self.view.setContent(_EMPTY_HTML_BYTES, "text/html; charset=utf-8")
         self.statusBar().showMessage("準備完了")
 
 
@@ -587,7 +883,8 @@ class MainWindow(QMainWindow):
             return
 
         xml_path = Path(xml_path_str)
-        if not xml_path.exists():
+        st = _stat_or_none(xml_path)
+        if st is None or not stat.S_ISREG(st.st_mode):
             QMessageBox.warning(self, "ファイルが存在しません", str(xml_path))
             return
 
@@ -601,47 +898,120 @@ class MainWindow(QMainWindow):
     # ファイルツリー関連
     # ------------------------------------------------------------------
     def _populate_tree(self, root_folder: Path) -> None:
-        """root_folder 以下の XML ファイルをツリーに列挙する。"""
+        """
+        root_folder 直下の XML ファイルとサブフォルダをツリーに表示する。
+        サブフォルダの中身は展開されたときに読み込む（大きなフォルダでも開くのは直下の分だけ）。
+        """
         self.tree.clear()
+        self._watch_folder(root_folder)
 
         root_item = QTreeWidgetItem([str(root_folder)])
         root_item.setData(0, Qt.ItemDataRole.UserRole, root_folder)
         self.tree.addTopLevelItem(root_item)
 
-        for path in sorted(root_folder.rglob("*.xml")):
-            relative = path.relative_to(root_folder)
-            parts = relative.parts
-
-            parent_item = root_item
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    file_item = QTreeWidgetItem([part])
-                    file_item.setData(0, Qt.ItemDataRole.UserRole, path)
-                    parent_item.addChild(file_item)
-                else:
-                    found_child = None
-                    for j in range(parent_item.childCount()):
-                        child = parent_item.child(j)
-                        if child.text(0) == part:
-                            found_child = child
-                            break
-                    if found_child is None:
-                        new_folder = QTreeWidgetItem([part])
-                        new_folder.setData(
-                            0,
-                            Qt.ItemDataRole.UserRole,
-                            parent_item.data(0, Qt.ItemDataRole.UserRole) / part,
-                        )
-                        parent_item.addChild(new_folder)
-                        parent_item = new_folder
-                    else:
-                        parent_item = found_child
-
+        self._load_folder_children(root_item)
         self.tree.expandItem(root_item)
 
         self.current_folder = root_folder.resolve()
         self._update_folder_nav_buttons()
 
+    def _watch_folder(self, folder: Path) -> None:
+        """
+        folder（表示中のルートフォルダ）を監視対象にし、前に監視していたフォルダの監視はやめる。
+        監視していない間に変わっているかもしれないので、キャッシュはここで一度確かめる。
+        """
+        if self._watched_folder == folder:
+            return
+
+        if self._watched_folder is not None:
+            self._fs_watcher.removePath(str(self._watched_folder))
+            self._watched_folder = None
+
+        # 監視できないフォルダ（一部のネットワークドライブ等）は、ほかのフォルダと同じく更新日時で確かめる
+        if not self._fs_watcher.addPath(str(folder)):
+            return
+        self._watched_folder = folder
+
+        cached = self._tree_cache.get(folder)
+        if cached is not None:
+            st = _stat_or_none(folder)
+            if st is None or st.st_mtime_ns != cached[0]:
+                del self._tree_cache[folder]
+
+    def _list_folder(self, folder: Path) -> tuple[list[str], list[str]]:
+        """
+        folder 直下のサブフォルダ名と XML ファイル名を返す。
+        監視中のフォルダのキャッシュは変更通知で破棄されるので、残っていればそのまま使う。
+        それ以外のフォルダは、更新日時が読み込んだときと同じならキャッシュを使う。
+        """
+        cached = self._tree_cache.get(folder)
+        if cached is not None and folder == self._watched_folder:
+            return cached[1]
+
+        # 読み込み中の変更も次回拾えるよう、更新日時は一覧より先に取る
+        mtime = os.stat(folder).st_mtime_ns
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        listing = _scan_folder(folder)
+        self._tree_cache.pop(folder, None)
+        self._tree_cache[folder] = (mtime, listing)
+        if len(self._tree_cache) > self.TREE_CACHE_MAX:
+            # 一番古く読み込んだフォルダから捨てる
+            del self._tree_cache[next(iter(self._tree_cache))]
+        return listing
+
+    def _on_watched_directory_changed(self, path: str) -> None:
+        """監視中のフォルダに変更があったら、そのフォルダの一覧キャッシュを捨てる。"""
+        self._tree_cache.pop(Path(path), None)
+        if path not in self._fs_watcher.directories():
+            # フォルダ自体が削除・移動され、監視も外れた
+            self._watched_folder = None
+
+    def _load_folder_children(self, folder_item: QTreeWidgetItem) -> None:
+        """フォルダ項目の子（サブフォルダ・XML ファイル）を読み込んで追加する。"""
+        folder = folder_item.data(0, Qt.ItemDataRole.UserRole)
+        folder_item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+        )
+
+        try:
+            subdirs, xml_names = self._list_folder(folder)
+        except OSError as e:
+            # アクセス権の無いフォルダなどは空として扱う
+            self.statusBar().showMessage(f"フォルダを読み込めません: {folder} ({e})", 5000)
+            return
+
+        children: list[QTreeWidgetItem] = []
+        for name in subdirs:
+            sub_item = QTreeWidgetItem([name])
+            sub_item.setData(0, Qt.ItemDataRole.UserRole, folder / name)
+            # 中身は未読込。展開できるように矢印だけ出しておく
+            sub_item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+            children.append(sub_item)
+
+        for name in xml_names:
+            file_item = QTreeWidgetItem([name])
+            file_item.setData(0, Qt.ItemDataRole.UserRole, folder / name)
+            children.append(file_item)
+
+        # 追加する間は再描画・ソート・シグナルを止め、子はまとめて1回で追加する
+        sorting_enabled = self.tree.isSortingEnabled()
+        self.tree.setUpdatesEnabled(False)
+        self.tree.setSortingEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            folder_item.addChildren(children)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setSortingEnabled(sorting_enabled)
+            self.tree.setUpdatesEnabled(True)
+
+    def _on_tree_item_expanded(self, item: QTreeWidgetItem) -> None:
+        """未読込のフォルダ項目が初めて展開されたときに中身を読み込む。"""
+        if item.childIndicatorPolicy() == QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator:
+            self._load_folder_children(item)
+
     def _on_tree_item_double_clicked(self, item: QTreeWidgetItem, column: int) -> None:
         """ツリーで XML ファイルをダブルクリックしたときに、そのファイルを表示する。"""
         path_data = item.data(0, Qt.ItemDataRole.UserRole)
@@ -661,7 +1031,8 @@ class MainWindow(QMainWindow):
         - 同フォルダに同名 .xsl が必須
         - ない場合はエラー
         """
-        if not xml_path.exists() or not xml_path.is_file():
+        st = _stat_or_none(xml_path)
+        if st is None or not stat.S_ISREG(st.st_mode):
             QMessageBox.information(self, "ドロップエラー", "ファイルが存在しません。")
             return
 
@@ -670,7 +1041,7 @@ class MainWindow(QMainWindow):
             return
 
         xsl_path = xml_path.with_suffix(".xsl")
-        if not xsl_path.exists():
+        if _stat_or_none(xsl_path) is None:
             QMessageBox.critical(
                 self,
                 "スタイルシートが見つかりません",
@@ -692,31 +1063,90 @@ class MainWindow(QMainWindow):
     # XML を開いて表示（表示はtempプレビューのみ）
     # ------------------------------------------------------------------
     def open_xml(self, xml_path: Path) -> None:
-        """指定された XML ファイルを変換して右側ビューに表示する（表示用HTMLは temp のみ）"""
-        if not xml_path.exists():
+        """
+        指定された XML ファイルを変換して右側ビューに表示する（表示用HTMLは temp のみ）。
+        変換はバックグラウンドで行い、完了したら _on_xslt_finished で表示する。
+        """
+        xml_stat = _stat_or_none(xml_path)
+        if xml_stat is None:
             QMessageBox.warning(self, "ファイルが存在しません", str(xml_path))
             return
 
-        self.current_xml = xml_path
+        # 変換中の古い要求があれば、その結果は捨てる。
+        # まだ始まっていない変換はキューから外し、最新の XML をすぐに変換できるようにする
+        self._xslt_request_id += 1
+        self._pending_xml = None
+        self._xslt_pool.clear()
 
-        preview_html = self._get_preview_html_path(xml_path)
+        # XML / XSL が前回から変わっていなければ変換済みのプレビューを再利用する
+        preview_html = self._find_fresh_preview(xml_path, xml_stat)
+        if preview_html is not None:
+            self._show_preview(xml_path, preview_html)
+            return
 
-        try:
-            self.transformer.transform_to_html_file(xml_path, output_path=preview_html)
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "変換エラー",
-                "XML から HTML への変換に失敗しました。\n\n"
-                f"XML: {xml_path}\n\n"
-                f"エラー詳細:\n{e}",
-            )
-            self._show_empty_message()
+        worker = _XsltWorker(
+            self._xslt_request_id,
+            self.transformer,
+            xml_path,
+            xml_stat,
+            self._get_preview_dir(),
+            self.SET_CONTENT_MAX_BYTES,
+        )
+        worker.signals.finished.connect(self._on_xslt_finished)
+        worker.signals.error.connect(self._on_xslt_error)
+        self._pending_xml = xml_path
+        self._xslt_pool.start(worker)
+
+        self.statusBar().showMessage(f"変換中: {xml_path}")
+
+    def _on_xslt_finished(self, request_id: int, preview_html: Path, html_bytes: bytes) -> None:
+        """バックグラウンド変換が終わったら、最新の要求の結果だけを表示する。"""
+        if request_id != self._xslt_request_id or self._pending_xml is None:
             return
 
-        self.view.setUrl(QUrl.fromLocalFile(str(preview_html)))
+        xml_path = self._pending_xml
+        self._pending_xml = None
+        self._show_preview(xml_path, preview_html, html_bytes)
+
+    def _show_preview(self, xml_path: Path, preview_html: Path, html_bytes: bytes | None = None) -> None:
+        """
+        変換済みの HTML を右側ビューに表示する。
+        小さいものは setContent で直接渡し、ファイルの読み直しを省く。
+        その際 baseUrl を XML にして、XML と同じフォルダの画像・CSS などの相対参照を解決する。
+        表示を切り替えた時点で current_xml を更新する（保存・PDF 出力が表示内容と一致するように）。
+        """
+        self.current_xml = xml_path
+
+        if html_bytes is None and preview_html.stat().st_size <= self.SET_CONTENT_MAX_BYTES:
+            html_bytes = preview_html.read_bytes()
+
+        if html_bytes is not None and len(html_bytes) <= self.SET_CONTENT_MAX_BYTES:
+            self.view.setContent(html_bytes, "text/html", QUrl.fromLocalFile(str(xml_path)))
+        else:
+            # <base> 入りの表示用ファイルがあればそちらを開く（相対参照を XML のフォルダから解決する）
+            view_html = _preview_view_path(preview_html)
+            self.view.setUrl(QUrl.fromLocalFile(str(view_html if view_html.exists() else preview_html)))
+
         self.statusBar().showMessage(f"表示中（プレビュー）: {xml_path}")
 
+    def _on_xslt_error(self, request_id: int, error: Exception) -> None:
+        """バックグラウンド変換が失敗した場合（最新の要求のみ）エラーを表示する。"""
+        if request_id != self._xslt_request_id or self._pending_xml is None:
+            return
+
+        xml_path = self._pending_xml
+        self._pending_xml = None
+        self.current_xml = xml_path
+
+        QMessageBox.critical(
+            self,
+            "変換エラー",
+            "XML から HTML への変換に失敗しました。\n\n"
+            f"XML: {xml_path}\n\n"
+            f"エラー詳細:\n{error}",
+        )
+        self._show_empty_message()
+
     # ------------------------------------------------------------------
     # HTML / PDF 保存関連
     # ------------------------------------------------------------------
@@ -749,7 +1179,13 @@ class MainWindow(QMainWindow):
         html_path = xml_path.with_suffix(".html")
 
         try:
-            self.transformer.transform_to_html_file(xml_path, output_path=html_path)
+            # 表示中のプレビューが最新なら、変換し直さずにそのままコピーする
+            # （鮮度は transformer が実際に使った XSL で判定する）
+            preview_html = self._find_fresh_preview(xml_path)
+            if preview_html is not None:
+                shutil.copyfile(preview_html, html_path)
+            else:
+                self.transformer.transform_to_html_file(xml_path, output_path=html_path)
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
+import os
 import re
-import shlex
+import threading
 from lxml import etree
 
 # アプリ側で強制的に当てたい CSS
@@ -13,6 +18,35 @@ pre.oshirase {
 }
 """
 
+# <xsl:output> の要素名（名前空間付き）
+XSL_OUTPUT_TAG = "{http://www.w3.org/1999/XSL/Transform}output"
+
+# 既存の <meta ... charset=...> を検出する正規表現（呼び出しごとにコンパイルしない）
+_META_CHARSET_RE = re.compile(rb"<meta\s+[^>]*charset\s*=", re.IGNORECASE)
+
+# <head ...> / </head> の位置を探す正規表現（html.lower() で全体をコピーせずに大文字小文字を無視する）
+_HEAD_OPEN_RE = re.compile(rb"<head\b[^>]*>", re.IGNORECASE)
+_HEAD_CLOSE_RE = re.compile(rb"</head>", re.IGNORECASE)
+_HEAD_CLOSE_STR_RE = re.compile(r"</head>", re.IGNORECASE)
+
+# xml-stylesheet 処理命令の href 疑似属性（例: type="text/xsl" href="7100001.xsl"）
+_PI_HREF_RE = re.compile(r"""(?:^|\s)href\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+@functools.lru_cache(maxsize=None)
+def _is_ascii_compatible(encoding: str) -> bool:
+    """
+    encoding で ASCII の文字がそのまま1バイトになるか（UTF-8 / Shift_JIS などは True、UTF-16 / UTF-32 は False）。
+    False の encoding では、バイト列のまま <head> を探したり meta / CSS を差し込んだりできない。
+    """
+    return "<".encode(encoding, errors="replace") == b"<"
+
+
+@functools.lru_cache(maxsize=None)
+def _style_block_bytes(encoding: str) -> bytes:
+    """CUSTOM_CSS の <style> ブロックを、差し込み先の HTML と同じ encoding でエンコードしたもの"""
+    return ("<style>\n" + CUSTOM_CSS + "\n</style>\n").encode(encoding, errors="replace")
+
 
 class XmlXsltTransformer:
     """
@@ -21,9 +55,35 @@ class XmlXsltTransformer:
     XSLT 変換して HTML を返すクラス。
     """
 
+    # コンパイル済み XSLT のキャッシュ（LRU、str(xsl_path) -> (st_mtime_ns, XSLT)）
+    # インスタンス間で共有し、同じ XSL を使う XML では parse + compile を省略する
+    # XML ごとに XSL が別ファイルなので、開いた XML の数だけ増えないよう上限を設ける
+    XSLT_CACHE_MAX = 16
+    _xslt_cache: OrderedDict[str, tuple[int, etree.XSLT]] = OrderedDict()
+    _xslt_cache_lock = threading.Lock()
+
+    # XSL の <xsl:output> 設定のキャッシュ（LRU、str(xsl_path) -> (st_mtime_ns, encoding, method)）
+    # キーはコンパイル済み XSLT と同じなので、上限も XSLT_CACHE_MAX にそろえる
+    _output_settings_cache: OrderedDict[str, tuple[int, str, str | None]] = OrderedDict()
+    _output_settings_cache_lock = threading.Lock()
+
+    # XML 読み込み用パーサ（ID の索引は使わないので collect_ids=False）
+    # lxml のパーサはスレッド間で共有できないため、スレッドごとに1つ作って使い回す
+    _parser_local = threading.local()
+
+    # 生成済み HTML バイト列のキャッシュ（LRU）
+    # キー: (str(xml_path), xml の st_mtime_ns, str(xsl_path), xsl の st_mtime_ns)
+    # どちらかが更新されれば mtime が変わるので、古いエントリは自然に使われなくなる
+    HTML_CACHE_MAX = 32
+    _html_cache: OrderedDict[tuple[str, int, str, int], bytes] = OrderedDict()
+    _html_cache_lock = threading.Lock()
+
     def __init__(self, xml_path: str | Path | None = None):
         # xml_path は optional にする（MainWindow 側で引数なし生成できるように）
         self.xml_path: Path | None = Path(xml_path) if xml_path is not None else None
+        # XML ごとに決定済みの XSL パス（str(xml_path) -> (xml の st_mtime_ns, xsl_path)）
+        # XML が変わっていなければ、XML を読み直さずに XSL を決められる
+        self._resolved_xsl: dict[str, tuple[int, Path]] = {}
 
     # --- 内部ヘルパー ---
 
@@ -32,17 +92,31 @@ class XmlXsltTransformer:
         メソッド引数 xml_path があればそれを採用、
         なければ self.xml_path を使う。どちらも無ければエラー。
         """
+        if isinstance(xml_path, Path):
+            # すでに Path なら作り直さない
+            return xml_path
         if xml_path is not None:
             return Path(xml_path)
         if self.xml_path is not None:
             return self.xml_path
         raise TypeError("xml_path が指定されていません。transform_to_* の引数で指定してください。")
 
+    def _get_xml_parser(self) -> etree.XMLParser:
+        """このスレッド用の XML パーサを返す（初回のみ作成）"""
+        parser = getattr(self._parser_local, "parser", None)
+        if parser is None:
+            parser = etree.XMLParser(collect_ids=False)
+            self._parser_local.parser = parser
+        return parser
+
     def _load_xml_tree(self, xml_path: Path) -> etree._ElementTree:
         """XMLを読み込んでツリーにして返す"""
-        if not xml_path.exists():
-            raise FileNotFoundError(f"XMLファイルが見つかりません: {xml_path}")
-        return etree.parse(str(xml_path))
+        # 存在確認の stat はせず、読めなかったときの lxml の OSError を言い換える
+        # （構文エラーの XMLSyntaxError はそのまま上げる）
+        try:
+            return etree.parse(os.fspath(xml_path), self._get_xml_parser())
+        except OSError as e:
+            raise FileNotFoundError(f"XMLファイルが見つかりません: {xml_path}") from e
 
     def _get_expected_xsl_name(self, xml_path: Path) -> str:
         """
@@ -56,21 +130,16 @@ class XmlXsltTransformer:
         xml-stylesheet 処理命令から href を読み取る。
         見つからなければ None を返す。
         """
+        # ルート要素より前にある処理命令だけを、近い順に見る
         root = xml_tree.getroot()
-        node = root.getprevious()
-
-        while node is not None:
-            if isinstance(node, etree._ProcessingInstruction) and node.target == "xml-stylesheet":
+        for node in root.itersiblings(tag=etree.ProcessingInstruction, preceding=True):
+            if node.target == "xml-stylesheet" and node.text:
                 # 例: node.text -> 'type="text/xsl" href="7100001.xsl"'
-                if node.text:
-                    parts = shlex.split(node.text)
-                    attrs: dict[str, str] = {}
-                    for part in parts:
-                        if "=" in part:
-                            key, value = part.split("=", 1)
-                            attrs[key] = value
-                    return attrs.get("href")
-            node = node.getprevious()
+                # node.get("href") は疑似属性を全部 dict にするので、href だけを正規表現で取り出す
+                m = _PI_HREF_RE.search(node.text)
+                if m is None:
+                    return None
+                return m.group(1) if m.group(1) is not None else m.group(2)
 
         return None
 
@@ -114,6 +183,29 @@ class XmlXsltTransformer:
 
         return xsl_path
 
+    def _get_compiled_xslt(self, xsl_path: Path) -> etree.XSLT:
+        """
+        コンパイル済みの XSLT を返す。
+        XSL の更新日時が変わっていなければキャッシュを再利用する。
+        """
+        key = str(xsl_path)
+        mtime = xsl_path.stat().st_mtime_ns
+        with self._xslt_cache_lock:
+            cached = self._xslt_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                self._xslt_cache.move_to_end(key)
+                return cached[1]
+
+        # compile はロックの外で行う（別の XSL の取得を待たせない）
+        transform = etree.XSLT(etree.parse(key))
+
+        with self._xslt_cache_lock:
+            self._xslt_cache[key] = (mtime, transform)
+            self._xslt_cache.move_to_end(key)
+            while len(self._xslt_cache) > self.XSLT_CACHE_MAX:
+                self._xslt_cache.popitem(last=False)
+        return transform
+
     # --- HTML 後処理ヘルパー ---
 
     def _inject_custom_css(self, html: str) -> str:
@@ -123,41 +215,105 @@ class XmlXsltTransformer:
         """
         style_block = "<style>\n" + CUSTOM_CSS + "\n</style>\n"
 
-        lower_html = html.lower()
-        idx = lower_html.find("</head>")
+        # libxslt の html 出力は小文字のタグなので、まずは正規表現を使わずに探す
+        pos = html.find("</head>")
+        if pos < 0:
+            m = _HEAD_CLOSE_STR_RE.search(html)
+            pos = m.start() if m is not None else -1
 
-        if idx != -1:
-            return html[:idx] + style_block + html[idx:]
+        if pos >= 0:
+            return html[:pos] + style_block + html[pos:]
         else:
             return style_block + html
 
-    def _has_meta_charset(self, html: str) -> bool:
-        """meta charset がすでにあるか簡易判定"""
-        return bool(re.search(r"<meta\s+[^>]*charset\s*=", html, re.IGNORECASE))
+    def _find_head_close(self, html: bytes, start: int = 0) -> int:
+        """
+        </head> の位置を返す（無ければ -1）。
+        libxslt の html 出力は小文字のタグなので、まず bytes.find で探し、
+        見つからない場合だけ大文字小文字を無視する正規表現で探し直す。
+        """
+        pos = html.find(b"</head>", start)
+        if pos >= 0:
+            return pos
+        m = _HEAD_CLOSE_RE.search(html, start)
+        return m.start() if m is not None else -1
 
-    def _inject_meta_charset(self, html: str, charset: str) -> str:
+    def _custom_css_insertion(self, head_close: int, encoding: str) -> tuple[int, bytes]:
         """
-        <head> 内に <meta charset="..."> を注入する。
-        すでに meta charset があれば何もしない。
+        アプリ専用 CSS の差し込み位置と内容を返す（_inject_custom_css のバイト列版）。
+        </head> の直前、</head> が無い場合（head_close < 0）は先頭。
+        CSS は HTML と同じ encoding でエンコードしたものを使う。
         """
-        if self._has_meta_charset(html):
-            return html
+        return max(head_close, 0), _style_block_bytes(encoding)
 
-        meta = f'<meta charset="{charset}">\n'
+    def _has_meta_charset(self, html: bytes, start: int = 0, end: int | None = None) -> bool:
+        """meta charset がすでにあるか簡易判定（start〜end の範囲だけを見る）"""
+        return _META_CHARSET_RE.search(html, start, len(html) if end is None else end) is not None
 
-        lower_html = html.lower()
-        head_open_idx = lower_html.find("<head")
-        if head_open_idx == -1:
+    def _meta_charset_insertion(
+        self,
+        html: bytes,
+        head_open: re.Match[bytes] | None,
+        head_close: int,
+        charset: str,
+    ) -> tuple[int, bytes] | None:
+        """
+        <head> 内に入れる <meta charset="..."> の位置と内容を返す。
+        すでに meta charset があれば None（何も入れない）。
+        meta は <head> の中にしか書かないので、<head> がある場合はその範囲だけを探す。
+        """
+        meta = f'<meta charset="{charset}">\n'.encode("ascii", errors="replace")
+
+        if head_open is None:
             # headが無いなら先頭に追加（最低限の保険）
-            return meta + html
+            if self._has_meta_charset(html):
+                return None
+            return 0, meta
+
+        head_end = head_close if head_close >= 0 else None
+        if self._has_meta_charset(html, head_open.end(), head_end):
+            return None
 
-        # <head ...> の ">" の位置を探す
-        head_end = lower_html.find(">", head_open_idx)
-        if head_end == -1:
-            return meta + html
+        # <head ...> の ">" の直後に入れる
+        return head_open.end(), b"\n" + meta
 
-        insert_pos = head_end + 1
-        return html[:insert_pos] + "\n" + meta + html[insert_pos:]
+    def _inject_into_html_bytes(
+        self,
+        html: bytes,
+        encoding: str,
+        method: str | None = None,
+        charset: str | None = None,
+    ) -> bytes:
+        """
+        変換結果の HTML に meta charset とアプリ専用 CSS を差し込む。
+        <head> / </head> の位置は1回ずつだけ探し、
+        差し込みごとに HTML 全体を作り直さず、最後に1回だけ連結する（大きな HTML でもコピーは1回）。
+        method は XSL の <xsl:output method="...">（指定なしなら None）。
+        charset は meta に書く charset（省略時は encoding。html のバイト列は encoding のもの）。
+        """
+        head_open = _HEAD_OPEN_RE.search(html)
+        head_close = self._find_head_close(html, head_open.end() if head_open is not None else 0)
+
+        insertions: list[tuple[int, bytes]] = []
+        # method="html" なら libxslt が <head> の直後に
+        # <meta http-equiv="Content-Type" ...> を必ず書くので、meta を探す必要はない
+        if method != "html" or head_open is None:
+            meta = self._meta_charset_insertion(html, head_open, head_close, charset or encoding)
+            if meta is not None:
+                insertions.append(meta)
+        insertions.append(self._custom_css_insertion(head_close, encoding))
+        # 同じ位置なら meta → CSS の順（sort は安定）
+        insertions.sort(key=lambda item: item[0])
+
+        view = memoryview(html)
+        chunks: list[bytes | memoryview] = []
+        last = 0
+        for pos, data in insertions:
+            chunks.append(view[last:pos])
+            chunks.append(data)
+            last = pos
+        chunks.append(view[last:])
+        return b"".join(chunks)
 
     def _normalize_charset(self, enc: str | None) -> str:
         """docinfo などで取れた encoding を保存向けに正規化する"""
@@ -169,41 +325,207 @@ class XmlXsltTransformer:
             return "Shift_JIS"
         return e
 
-    def _get_output_encoding_from_xsl(self, xsl_path: Path) -> str:
+    def _get_output_settings_from_xsl(self, xsl_path: Path) -> tuple[str, str | None]:
         """
-        XSL側の <xsl:output encoding="..."> を最優先で読む。
-        無ければ UTF-8。
+        XSL側の <xsl:output encoding="..." method="..."> を読み、(encoding, method) を返す。
+        encoding が無ければ UTF-8、method が無ければ None。
+        XSL の更新日時が変わっていなければ、前回読んだ結果を返す。
         """
+        key = str(xsl_path)
+        try:
+            mtime = xsl_path.stat().st_mtime_ns
+        except OSError:
+            return "UTF-8", None
+
+        with self._output_settings_cache_lock:
+            cached = self._output_settings_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                self._output_settings_cache.move_to_end(key)
+                return cached[1], cached[2]
+
+        # 属性を読むだけなので XSL 全体のツリーは作らず、
+        # <xsl:output> の開始タグが見つかった時点で読むのをやめる
+        encoding = "UTF-8"
+        method = None
         try:
-            xsl_tree = etree.parse(str(xsl_path))
-            root = xsl_tree.getroot()
-            ns = root.nsmap.get("xsl", "http://www.w3.org/1999/XSL/Transform")
-            out = root.find(f"{{{ns}}}output")
-            if out is not None:
-                enc = out.get("encoding")
-                return self._normalize_charset(enc)
+            for _, out in etree.iterparse(key, events=("start",), tag=XSL_OUTPUT_TAG):
+                encoding = self._normalize_charset(out.get("encoding"))
+                method = out.get("method")
+                break
         except Exception:
             pass
-        return "UTF-8"
+
+        with self._output_settings_cache_lock:
+            self._output_settings_cache[key] = (mtime, encoding, method)
+            self._output_settings_cache.move_to_end(key)
+            while len(self._output_settings_cache) > self.XSLT_CACHE_MAX:
+                self._output_settings_cache.popitem(last=False)
+        return encoding, method
+
+    # --- 変換本体 ---
+
+    def _transform(
+        self,
+        xml_path: Path,
+        xml_tree: etree._ElementTree | None = None,
+        xsl_path: Path | None = None,
+    ) -> tuple[etree._XSLTResultTree, Path]:
+        """
+        XML の読み込み・XSL の決定・XSLT 変換を1回だけ行い、
+        (変換結果のツリー, 使った XSL のパス) を返す。
+        読み込み済みの XML ツリーや決定済みの XSL があれば渡せる（その手順は省く）。
+        """
+        if xml_tree is None:
+            xml_tree = self._load_xml_tree(xml_path)
+        if xsl_path is None:
+            xsl_path = self._resolve_xsl_path(xml_path, xml_tree)
+
+        transform = self._get_compiled_xslt(xsl_path)
+        result_tree = transform(xml_tree)
+
+        return result_tree, xsl_path
+
+    def _render_html_bytes(
+        self,
+        xml_path: Path,
+        xml_tree: etree._ElementTree | None = None,
+        xsl_path: Path | None = None,
+    ) -> tuple[bytes, Path]:
+        """
+        _transform の結果に meta charset とアプリ専用 CSS を差し込み、
+        (HTML のバイト列, 使った XSL のパス) を返す（HTML キャッシュは使わない）。
+        """
+        result_tree, xsl_path = self._transform(xml_path, xml_tree, xsl_path)
+        out_enc, out_method = self._get_output_settings_from_xsl(xsl_path)
+
+        if not _is_ascii_compatible(out_enc):
+            # UTF-16 などはバイト列のまま差し込めないので、文字列から UTF-8 にして差し込み、
+            # 最後に本来の encoding でエンコードし直す（meta には本来の encoding を書く）
+            html_utf8 = self._inject_into_html_bytes(
+                str(result_tree).encode("utf-8"), "UTF-8", out_method, charset=out_enc
+            )
+            return html_utf8.decode("utf-8").encode(out_enc, errors="replace"), xsl_path
+
+        return self._inject_into_html_bytes(bytes(result_tree), out_enc, out_method), xsl_path
+
+    # --- HTML キャッシュ ---
+
+    @staticmethod
+    def _html_cache_key(xml_path: Path, xsl_path: Path) -> tuple[str, int, str, int]:
+        return (
+            str(xml_path),
+            xml_path.stat().st_mtime_ns,
+            str(xsl_path),
+            xsl_path.stat().st_mtime_ns,
+        )
+
+    def _memoized_html_cache_key(self, xml_path: Path) -> tuple[str, int, str, int] | None:
+        """
+        XML が前回から変わっていなければ、メモ済みの XSL パスで HTML キャッシュのキーを作る。
+        メモが無い・使えない場合は None（XML を読んで XSL を決める通常の経路に任せる）。
+        """
+        key = str(xml_path)
+        try:
+            xml_mtime = xml_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        memo = self._resolved_xsl.get(key)
+        if memo is None or memo[0] != xml_mtime:
+            return None
+
+        xsl_path = memo[1]
+        try:
+            xsl_mtime = xsl_path.stat().st_mtime_ns
+        except OSError:
+            # XSL が消えた等。メモを捨てて、エラー報告も含めて通常の経路に任せる
+            self._resolved_xsl.pop(key, None)
+            return None
+
+        return key, xml_mtime, str(xsl_path), xsl_mtime
+
+    @classmethod
+    def _get_cached_html(cls, key: tuple[str, int, str, int]) -> bytes | None:
+        with cls._html_cache_lock:
+            html_bytes = cls._html_cache.get(key)
+            if html_bytes is not None:
+                cls._html_cache.move_to_end(key)
+            return html_bytes
+
+    @classmethod
+    def _store_cached_html(cls, key: tuple[str, int, str, int], html_bytes: bytes) -> None:
+        with cls._html_cache_lock:
+            cls._html_cache[key] = html_bytes
+            cls._html_cache.move_to_end(key)
+            while len(cls._html_cache) > cls.HTML_CACHE_MAX:
+                cls._html_cache.popitem(last=False)
 
     # --- 公開メソッド ---
 
     def transform_to_html_string(self, xml_path: str | Path | None = None) -> str:
         """XSLT 変換して HTML 文字列を返すメイン関数（xml_path は引数で渡せる）"""
         xml_path_p = self._require_xml_path(xml_path)
-
-        xml_tree = self._load_xml_tree(xml_path_p)
-        xsl_path = self._resolve_xsl_path(xml_path_p, xml_tree)
-
-        xsl_tree = etree.parse(str(xsl_path))
-        transform = etree.XSLT(xsl_tree)
-        result_tree = transform(xml_tree)
+        result_tree, _ = self._transform(xml_path_p)
 
         html_str = str(result_tree)
         html_str = self._inject_custom_css(html_str)
 
         return html_str
 
+    def transform_to_html_bytes(self, xml_path: str | Path | None = None) -> bytes:
+        """
+        XSLT 変換して、保存用と同じ HTML をバイト列で返す。
+
+        - XSL側で encoding 指定がある場合は、その encoding でエンコードする
+          （lxml が <xsl:output> に従って直接シリアライズするので、文字列を経由しない。
+          UTF-16 など ASCII 互換でない encoding だけは文字列を経由する）
+        - <meta charset> を注入するので、そのままブラウザに渡せる
+        """
+        html_bytes, _ = self.transform_to_html_bytes_with_xsl(xml_path)
+        return html_bytes
+
+    def transform_to_html_bytes_with_xsl(self, xml_path: str | Path | None = None) -> tuple[bytes, Path]:
+        """
+        transform_to_html_bytes と同じ HTML と、変換に実際に使った XSL のパスを返す。
+        XSL は xml-stylesheet の href から決まるので、XML と同じフォルダとは限らない。
+        """
+        xml_path_p = self._require_xml_path(xml_path)
+
+        # XML / XSL とも更新されていなければ、前回生成した HTML をそのまま返す
+        # （XSL パスがメモ済みなら XML の読み込みも省く）
+        xml_tree: etree._ElementTree | None = None
+        cache_key = self._memoized_html_cache_key(xml_path_p)
+        if cache_key is not None:
+            xsl_path = Path(cache_key[2])
+        else:
+            xml_tree = self._load_xml_tree(xml_path_p)
+            xsl_path = self._resolve_xsl_path(xml_path_p, xml_tree)
+            cache_key = self._html_cache_key(xml_path_p, xsl_path)
+            self._resolved_xsl[cache_key[0]] = (cache_key[1], xsl_path)
+
+        cached = self._get_cached_html(cache_key)
+        if cached is not None:
+            return cached, xsl_path
+
+        html_bytes, _ = self._render_html_bytes(xml_path_p, xml_tree, xsl_path)
+        self._store_cached_html(cache_key, html_bytes)
+        return html_bytes, xsl_path
+
+    def get_resolved_xsl_path(self, xml_path: str | Path) -> Path | None:
+        """
+        前回の変換で決定した XSL のパスを返す（XML は読まない）。
+        まだ変換していない XML や、前回から更新された XML では None。
+        """
+        xml_path_p = self._require_xml_path(xml_path)
+        memo = self._resolved_xsl.get(str(xml_path_p))
+        if memo is None:
+            return None
+        try:
+            xml_mtime = xml_path_p.stat().st_mtime_ns
+        except OSError:
+            return None
+        return memo[1] if memo[0] == xml_mtime else None
+
     def transform_to_html_file(
         self,
         xml_path: str | Path,
@@ -215,30 +537,64 @@ class XmlXsltTransformer:
         - output_path を省略した場合: XML と同名 .html
         - XSL側で encoding 指定がある場合は、その encoding で保存する
         """
-        xml_path_p = Path(xml_path)
-
-        html_str = self.transform_to_html_string(xml_path_p)
-
-        xml_tree = self._load_xml_tree(xml_path_p)
-        xsl_path = self._resolve_xsl_path(xml_path_p, xml_tree)
-        out_enc = self._get_output_encoding_from_xsl(xsl_path)
+        xml_path_p = self._require_xml_path(xml_path)
 
-        html_str = self._inject_meta_charset(html_str, out_enc)
+        html_bytes = self.transform_to_html_bytes(xml_path_p)
 
         if output_path is None:
             output_path = xml_path_p.with_suffix(".html")
 
-        output_path_p = Path(output_path)
-        output_path_p.write_bytes(html_str.encode(out_enc, errors="replace"))
+        output_path_p = output_path if isinstance(output_path, Path) else Path(output_path)
+        output_path_p.write_bytes(html_bytes)
         return output_path_p
 
+    def transform_many(self, xml_paths: Iterable[str | Path]) -> Iterator[tuple[Path, bytes]]:
+        """
+        複数の XML をまとめて変換し、(XML のパス, HTML のバイト列) を入力順に返す。
+
+        - 同じ XSL を使う XML では、コンパイル済み XSLT とパーサを使い回す
+          （XSL の parse + compile は XSL ごとに1回だけ）
+        - 生成した HTML は HTML キャッシュに入れない（ビューア側のキャッシュを追い出さないように）
+        - 途中で変換に失敗した場合は、その XML の時点で例外を上げる
+        """
+        for xml_path in xml_paths:
+            xml_path_p = self._require_xml_path(xml_path)
+            html_bytes, _ = self._render_html_bytes(xml_path_p)
+            yield xml_path_p, html_bytes
+
+    def transform_many_parallel(
+        self,
+        xml_paths: Iterable[str | Path],
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[Path, bytes]]:
+        """
+        transform_many のスレッド並列版。結果は入力順に返す。
+
+        - libxml2 / libxslt は parse・変換の間 GIL を手放すので、ファイルが多いほど速くなる
+        - パーサはスレッドごとに持ち、コンパイル済み XSLT は全スレッドで共有する
+        - transform_many と同じく、生成した HTML は HTML キャッシュに入れない
+        - max_workers は ThreadPoolExecutor にそのまま渡す（None なら既定値）
+        - どれかの XML で失敗した場合、例外はその XML の結果を取り出す時点
+          （それより前の XML の結果をすべて取り出した後）で上がる
+        - 例外になった・途中で取り出すのをやめた場合は、まだ始まっていない変換を取り消し、
+          実行中の変換が終わるのだけを待って戻る
+        """
+        xml_path_list = [self._require_xml_path(xml_path) for xml_path in xml_paths]
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            results = executor.map(lambda p: self._render_html_bytes(p)[0], xml_path_list)
+            yield from zip(xml_path_list, results)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def transform_to_debug_html_file(
         self,
         xml_path: str | Path,
         output_path: str | Path | None = None,
     ) -> Path:
         """互換のため残す：.debug.html を出力する"""
-        xml_path_p = Path(xml_path)
+        xml_path_p = self._require_xml_path(xml_path)
         if output_path is None:
             output_path = xml_path_p.with_suffix(".debug.html")
         return self.transform_to_html_file(xml_path_p, output_path=output_path)